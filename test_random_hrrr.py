@@ -17,11 +17,14 @@ Arguments:
     --keep-files     Keep downloaded files after testing (default: clean up)
     --max-size MB    Maximum file size in MB to download (default: 50)
     --verbose        Show detailed output from tests
+    --seed N         Seed file selection for reproducible runs
 
 Requirements:
     - gsutil (Google Cloud SDK) or gcloud storage
     - wgrib2
     - Go (for running squall tests)
+    - google-cloud-storage (optional, for faster in-process downloads)
+    - tqdm (optional, for progress bars)
 
 Examples:
     python3 test_random_hrrr.py                      # Test 5 random files
@@ -31,6 +34,7 @@ Examples:
 
 import argparse
 import datetime
+import json
 import os
 import random
 import re
@@ -38,9 +42,49 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+try:
+    # Optional: the native client avoids ~1s of interpreter+auth startup per
+    # gsutil call and reuses one HTTPS connection across requests.
+    from google.cloud import storage
+    from google.cloud.storage import transfer_manager
+    _CLIENT = storage.Client.create_anonymous_client()  # HRRR bucket is public
+except ImportError:
+    _CLIENT = None
+    transfer_manager = None
+
+try:
+    # Optional: one repainted progress bar instead of a flood of full
+    # status lines during the probe and download loops.
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+BUCKET_NAME = 'high-resolution-rapid-refresh'
+GCS_PREFIX = f'gs://{BUCKET_NAME}/'
+
+# Cap concurrent GCS requests across probes, listings, and downloads.
+# Fanning out much wider triggers 429 throttling and inflates tail
+# latency, which regresses throughput instead of improving it.
+_GCS_CONCURRENCY = max(1, int(os.environ.get('SQUALL_GCS_CONCURRENCY', '16')))
+_GCS_SEM = threading.BoundedSemaphore(_GCS_CONCURRENCY)
+
+# Size of the download thread pool; chunked transfers divide the request
+# budget by this so the pool can't overshoot the cap above.
+_DOWNLOAD_WORKERS = 4
+
+
+def _status(msg: str) -> None:
+    """Print a status line without clobbering an active progress bar."""
+    if tqdm is not None:
+        tqdm.write(msg)
+    else:
+        print(msg)
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -54,6 +98,18 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+# Message templates for the hot print paths, built once at import; only
+# the filename (and size/error detail) varies per call.
+_DOWNLOADED_MSG = Colors.GREEN + '✓ Downloaded: {} ({:.1f} MB)' + Colors.NC
+_DOWNLOAD_FAILED_MSG = Colors.YELLOW + '✗ Failed to download {}' + Colors.NC
+_DOWNLOAD_TIMEOUT_MSG = Colors.YELLOW + '✗ Timeout downloading {}' + Colors.NC
+_DOWNLOAD_ERROR_MSG = Colors.YELLOW + '✗ Error downloading {}: {}' + Colors.NC
+_PASS_MSG = Colors.GREEN + '✓ PASSED: {}' + Colors.NC
+_FAIL_MSG = Colors.RED + '✗ FAILED: {}' + Colors.NC
+_TEST_TIMEOUT_MSG = Colors.RED + '✗ TIMEOUT: {}' + Colors.NC
+_TEST_ERROR_MSG = Colors.RED + '✗ ERROR testing {}: {}' + Colors.NC
+
+
 def check_dependencies() -> bool:
     """Check if required dependencies are installed."""
     print(f"{Colors.BLUE}Checking dependencies...{Colors.NC}")
@@ -66,6 +122,9 @@ def check_dependencies() -> bool:
 
     missing = []
     for cmd, install_info in dependencies.items():
+        if cmd == 'gsutil' and _CLIENT is not None:
+            print(f"{Colors.GREEN}✓ google-cloud-storage found{Colors.NC} (gsutil not needed)")
+            continue
         if not shutil.which(cmd):
             print(f"{Colors.RED}✗ {cmd} not found{Colors.NC}")
             print(f"  Install: {install_info}")
@@ -82,27 +141,84 @@ def check_dependencies() -> bool:
     return True
 
 
+_VERSION_CACHE_FILE = Path.home() / '.cache' / 'squall_test_random_hrrr' / 'versions.json'
+
+# Version-probe patterns, compiled once at import
+_WGRIB2_VER_RE = re.compile(r'v(\d+\.\d+\.\d+[^ ]*)')
+_GO_VER_RE = re.compile(r'go(\d+\.\d+(?:\.\d+)?)')
+_GSUTIL_VER_RE = re.compile(r'(\d+\.\d+)')
+
+
+def _load_version_cache() -> dict:
+    try:
+        with open(_VERSION_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_version_cache(cache: dict) -> None:
+    """Write the version cache atomically so concurrent runs can't corrupt it."""
+    try:
+        _VERSION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _VERSION_CACHE_FILE.with_suffix('.json.tmp')
+        tmp.write_text(json.dumps(cache))
+        os.replace(tmp, _VERSION_CACHE_FILE)
+    except OSError:
+        pass  # the cache is best-effort
+
+
 def get_version(cmd: str) -> str:
-    """Get version string for a command."""
+    """Get version string for a command.
+
+    A version string is a pure function of the binary, so probe results are
+    cached on disk keyed by the resolved path and its mtime. This skips
+    ~1-2s of subprocess startup (gsutil especially) on every warm run.
+    """
+    path = shutil.which(cmd)
+    if not path:
+        return ""
+
+    try:
+        key = f"{path}:{os.path.getmtime(path)}"
+    except OSError:
+        key = None
+
+    cache = _load_version_cache()
+    if key is not None and key in cache:
+        return cache[key]
+
+    version = _probe_version(cmd)
+
+    # Don't cache failed probes; retry them on the next run.
+    if key is not None and version:
+        cache[key] = version
+        _store_version_cache(cache)
+
+    return version
+
+
+def _probe_version(cmd: str) -> str:
+    """Ask the binary itself for its version string."""
     try:
         if cmd == 'wgrib2':
             result = subprocess.run([cmd, '-version'], capture_output=True, text=True, timeout=5)
-            match = re.search(r'v(\d+\.\d+\.\d+[^ ]*)', result.stdout)
+            match = _WGRIB2_VER_RE.search(result.stdout)
             return f"({match.group(1)})" if match else ""
         elif cmd == 'go':
             result = subprocess.run([cmd, 'version'], capture_output=True, text=True, timeout=5)
-            match = re.search(r'go(\d+\.\d+(?:\.\d+)?)', result.stdout)
+            match = _GO_VER_RE.search(result.stdout)
             return f"({match.group(1)})" if match else ""
         elif cmd == 'gsutil':
             result = subprocess.run([cmd, 'version'], capture_output=True, text=True, timeout=5)
-            match = re.search(r'(\d+\.\d+)', result.stdout)
+            match = _GSUTIL_VER_RE.search(result.stdout)
             return f"({match.group(1)})" if match else ""
     except Exception:
         pass
     return ""
 
 
-def get_available_dates(days_back: int = 365 * 11) -> List[str]:
+def get_available_dates(rng: random.Random, days_back: int = 365 * 11) -> List[str]:
     """Get list of available dates from HRRR bucket, prioritizing recent dates."""
     print(f"{Colors.BLUE}Generating date range from HRRR archive...{Colors.NC}")
 
@@ -118,116 +234,440 @@ def get_available_dates(days_back: int = 365 * 11) -> List[str]:
         current += datetime.timedelta(days=1)
 
     # Shuffle for randomness
-    random.shuffle(dates)
+    rng.shuffle(dates)
 
     print(f"{Colors.GREEN}Generated {len(dates)} recent dates (last 10 days){Colors.NC}")
     return dates
 
 
-def get_random_files_from_date(date: str, count: int, max_size_mb: Optional[float], verbose: bool = False) -> List[Tuple[str, int]]:
-    """Get random GRIB2 files from a specific date with their sizes."""
-    if verbose:
-        print(f"{Colors.BLUE}Trying date {date}...{Colors.NC}", end=' ')
+def _list_date_files_native(date: str, max_size_bytes: float) -> List[Tuple[str, int]]:
+    """List matching GRIB2 files for a date via the storage client."""
+    files = []
+    with _GCS_SEM:
+        blobs = _CLIENT.bucket(BUCKET_NAME).list_blobs(prefix=f'hrrr.{date}/conus/')
+        for blob in blobs:
+            if blob.name.endswith('.grib2') and '.wrfnatf' in blob.name and blob.size <= max_size_bytes:
+                files.append((GCS_PREFIX + blob.name, blob.size))
+    return files
 
-    bucket = "gs://high-resolution-rapid-refresh"
-    path = f"{bucket}/hrrr.{date}/conus/"
 
-    try:
-        # Use -l to get sizes (shorter timeout to fail fast on missing dates)
-        result = subprocess.run(
-            ['gsutil', 'ls', '-l', path],
-            capture_output=True,
-            text=True,
-            timeout=15
-        )
+def get_random_files_from_date(date: str, count: int, max_size_mb: Optional[float], rng: random.Random, verbose: bool = False) -> List[Tuple[str, int]]:
+    """Get random GRIB2 files from a specific date with their sizes.
 
-        if result.returncode != 0:
-            if verbose:
-                print(f"{Colors.YELLOW}not found{Colors.NC}")
-            return []
-
-        # Parse output: size date time url
-        files = []
-        max_size_bytes = max_size_mb * 1024 * 1024 if max_size_mb else float('inf')
-
-        for line in result.stdout.splitlines():
-            parts = line.split()
-            if len(parts) >= 3 and parts[-1].endswith('.grib2') and '.wrfnatf' in parts[-1]:
-                try:
-                    size = int(parts[0])
-                    url = parts[-1]
-                    if size <= max_size_bytes:
-                        files.append((url, size))
-                except ValueError:
-                    continue
+    Native-client path only; probes run concurrently, so verbose output is
+    a single print per date to keep lines from interleaving.
+    """
+    max_size_bytes = max_size_mb * 1024 * 1024 if max_size_mb else float('inf')
+
+    try:
+        files = _list_date_files_native(date, max_size_bytes)
 
         # Shuffle and return requested count
-        random.shuffle(files)
+        rng.shuffle(files)
         selected = files[:count]
 
         if verbose:
             if selected:
-                print(f"{Colors.GREEN}found {len(selected)} file(s){Colors.NC}")
+                print(f"{Colors.BLUE}Date {date}:{Colors.NC} {Colors.GREEN}found {len(selected)} file(s){Colors.NC}")
             else:
-                print(f"{Colors.YELLOW}no files within size limit{Colors.NC}")
+                print(f"{Colors.BLUE}Date {date}:{Colors.NC} {Colors.YELLOW}no files within size limit{Colors.NC}")
 
         return selected
 
-    except subprocess.TimeoutExpired:
-        if verbose:
-            print(f"{Colors.YELLOW}timeout{Colors.NC}")
-        return []
     except Exception as e:
         if verbose:
-            print(f"{Colors.YELLOW}error: {e}{Colors.NC}")
+            print(f"{Colors.BLUE}Date {date}:{Colors.NC} {Colors.YELLOW}error: {e}{Colors.NC}")
         return []
 
 
-def download_file(gcs_path: str, local_path: Path) -> bool:
-    """Download a GRIB2 file from GCS."""
-    filename = os.path.basename(gcs_path)
-    print(f"{Colors.BLUE}Downloading: {filename}{Colors.NC}")
+def _random_candidate_url(date: str, rng: random.Random) -> str:
+    """Construct a random HRRR native-grid URL from the fixed name schema."""
+    hour = rng.randrange(24)
+    # The four synoptic cycles run out to 48h; the others stop at 18h.
+    max_fh = 48 if hour % 6 == 0 else 18
+    fh = rng.randrange(max_fh + 1)
+    return f'{GCS_PREFIX}hrrr.{date}/conus/hrrr.t{hour:02d}z.wrfnatf{fh:02d}.grib2'
+
+
+def _probe_candidates_native(dates: List[str], num_files: int, max_size_mb: Optional[float], rng: random.Random, verbose: bool = False) -> Tuple[List[Tuple[str, int]], int, int]:
+    """Collect candidate files by probing deterministic HRRR URLs.
+
+    HRRR filenames follow a fixed schema, so instead of listing whole
+    conus/ directories (thousands of entries per date) we sample random
+    (date, cycle, forecast hour) tuples and fetch each candidate's
+    metadata with a single request.
+    """
+    max_size_bytes = max_size_mb * 1024 * 1024 if max_size_mb else float('inf')
+    bucket = _CLIENT.bucket(BUCKET_NAME)
+
+    # Generous headroom: probes miss on oversize files and on cycles that
+    # haven't landed in the archive yet. Sorted so that selection below
+    # follows a fixed URL order, reproducible under --seed (set iteration
+    # order is not stable across interpreter runs).
+    candidates = sorted({_random_candidate_url(rng.choice(dates[:20]), rng)
+                         for _ in range(num_files * 4)})
+
+    def probe(url: str) -> Optional[Tuple[str, int]]:
+        blob = bucket.blob(url[len(GCS_PREFIX):])
+        try:
+            with _GCS_SEM:
+                blob.reload()  # one metadata GET, no listing
+        except Exception:
+            return None  # missing object (cycle not in the archive)
+        if blob.size is None or blob.size > max_size_bytes:
+            return None
+        return url, blob.size
+
+    files = []
+    probed_dates = set()
+    hit_dates = set()
+
+    progress = None
+    if tqdm is not None and not verbose:
+        progress = tqdm(total=len(candidates), desc='Probing candidates', unit='probe', leave=False)
+
+    executor = ThreadPoolExecutor(max_workers=8)
+    try:
+        futures = [(url, executor.submit(probe, url)) for url in candidates]
+        # Consume results in candidate order, not completion order: which
+        # files get picked then depends only on the seed, never on which
+        # probe happened to answer first.
+        for url, future in futures:
+            date_prefix = url.split('/conus/', 1)[0]
+            probed_dates.add(date_prefix)
+
+            result = future.result()
+            if result:
+                files.append(result)
+                hit_dates.add(date_prefix)
+                if verbose:
+                    print(f"{Colors.BLUE}Probe {url.rsplit('/', 1)[-1]}:{Colors.NC} "
+                          f"{Colors.GREEN}{result[1] / (1024 * 1024):.1f} MB{Colors.NC}")
+            elif verbose:
+                print(f"{Colors.BLUE}Probe {url.rsplit('/', 1)[-1]}:{Colors.NC} {Colors.YELLOW}miss{Colors.NC}")
+
+            if progress is not None:
+                progress.update(1)
+
+            if len(files) >= num_files:
+                break
+    finally:
+        if progress is not None:
+            progress.close()
+        # Same non-blocking teardown as the listing path: stragglers are
+        # discarded and downloads start immediately.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return files, len(probed_dates), len(hit_dates)
+
+
+def _collect_candidates_native(dates: List[str], num_files: int, max_size_mb: Optional[float], rng: random.Random, verbose: bool = False) -> Tuple[List[Tuple[str, int]], int, int]:
+    """Collect candidate files by probing dates concurrently via the client."""
+    files_to_download = []
+    dates_tried = 0
+    dates_with_files = 0
+
+    # Probe dates concurrently: each probe is an independent round trip,
+    # so fanning them out turns the discovery phase from sum-of-probes
+    # into max-of-probes. Every probe gets its own RNG, derived from the
+    # parent seed in a fixed order before any thread runs, so the
+    # per-date shuffles don't depend on thread timing.
+    executor = ThreadPoolExecutor(max_workers=8)
+    try:
+        # Safety limit: probe at most 20 dates
+        futures = [
+            (date, executor.submit(get_random_files_from_date, date, 2,
+                                   max_size_mb, random.Random(rng.random()),
+                                   verbose))
+            for date in dates[:20]
+        ]
+
+        # Consume results in submission order, not completion order, so
+        # which dates contribute files is reproducible under --seed.
+        for _date, future in futures:
+            dates_tried += 1
+
+            # Try to get 1-2 files from this date
+            date_files = future.result()
+
+            if date_files:
+                dates_with_files += 1
+                files_to_download.extend(date_files)
+
+                if not verbose:
+                    # Show progress dots
+                    if dates_with_files % 5 == 0:
+                        _status(f"  Found {len(files_to_download)} files so far (tried {dates_tried} dates)...")
+
+            if len(files_to_download) >= num_files:
+                break
+    finally:
+        # Don't block on in-flight probes once we have enough files:
+        # downloads can start immediately, and any stragglers finish in
+        # the background with their results discarded.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return files_to_download, dates_tried, dates_with_files
+
+
+def _collect_candidates_gsutil(dates: List[str], num_files: int, max_size_mb: Optional[float], rng: random.Random, verbose: bool = False) -> Tuple[List[Tuple[str, int]], int, int]:
+    """Collect candidate files for all dates with a single gsutil ls."""
+    # One listing covering every candidate date: one subprocess startup,
+    # one auth handshake, one metadata pass. (gsutil has no brace
+    # expansion, but ls accepts multiple wildcard URLs per invocation.)
+    dates = dates[:20]  # safety limit, as in the native path
+    urls = [f'{GCS_PREFIX}hrrr.{date}/conus/*.wrfnatf*.grib2' for date in dates]
+    max_size_bytes = max_size_mb * 1024 * 1024 if max_size_mb else float('inf')
+
+    files = []
+    # Stream the listing instead of buffering it: dense conus/ directories
+    # hold thousands of entries, and we only need enough of a pool to
+    # sample from. Stop the subprocess once we have a generous multiple.
+    enough = num_files * 20
 
     try:
-        result = subprocess.run(
-            ['gsutil', '-q', 'cp', gcs_path, str(local_path)],
-            capture_output=True,
-            timeout=300  # 5 minute timeout
-        )
+        with subprocess.Popen(
+            ['gsutil', 'ls', '-l'] + urls,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # missing dates only appear on stderr
+            text=True
+        ) as proc:
+            # Popen has no overall timeout, so keep the old 120s budget
+            # with a watchdog that kills a hung listing.
+            watchdog = threading.Timer(120, proc.kill)
+            watchdog.start()
+            try:
+                # Lines are "size date time url"; grab the outer columns
+                # without tokenizing the whole line, and filter on the
+                # cheap suffix check before parsing anything.
+                for line in proc.stdout:
+                    stripped = line.rstrip()
+                    if stripped.endswith('.grib2'):
+                        url = stripped.rsplit(None, 1)[-1]
+                        if '.wrfnatf' in url:
+                            try:
+                                size = int(stripped.split(None, 1)[0])
+                            except ValueError:
+                                continue
+                            if size <= max_size_bytes:
+                                files.append((url, size))
+
+                    if len(files) >= enough:
+                        proc.terminate()
+                        break
+            finally:
+                watchdog.cancel()
+    except Exception as e:
+        print(f"{Colors.YELLOW}Error listing HRRR dates: {e}{Colors.NC}")
+        return [], len(dates), 0
+
+    dates_with_files = len({url.split('/conus/', 1)[0] for url, _size in files})
+    rng.shuffle(files)
+    return files, len(dates), dates_with_files
+
+
+def collect_candidate_files(dates: List[str], num_files: int, max_size_mb: Optional[float], rng: random.Random, verbose: bool = False) -> Tuple[List[Tuple[str, int]], int, int]:
+    """Collect candidate (url, size) pairs across dates.
+
+    Returns (files, dates_tried, dates_with_files). With the native client,
+    candidate URLs are constructed from the fixed HRRR name schema and
+    probed with one metadata request each, skipping directory listings
+    entirely; the listing-based collector tops up the remainder whenever
+    probing comes back short (and so also covers a stale schema
+    assumption). With gsutil, every subprocess pays ~1s of startup, so
+    all dates go into a single ls invocation.
+    """
+    if _CLIENT is not None:
+        files, dates_tried, dates_with_files = _probe_candidates_native(
+            dates, num_files, max_size_mb, rng, verbose)
+        if len(files) >= num_files:
+            return files, dates_tried, dates_with_files
+
+        # Probing undershot (a tight --max-size makes random candidates
+        # miss); the listing collector sees every object per date, so use
+        # it to top up the remainder.
+        more, more_tried, more_with = _collect_candidates_native(
+            dates, num_files - len(files), max_size_mb, rng, verbose)
+        seen = {url for url, _size in files}
+        files.extend(f for f in more if f[0] not in seen)
+        return files, max(dates_tried, more_tried), max(dates_with_files, more_with)
+    return _collect_candidates_gsutil(dates, num_files, max_size_mb, rng, verbose)
+
+
+# Above this size a single-stream GET is TCP-bandwidth-limited on WAN
+# links, so split the transfer into parallel range GETs instead.
+_CHUNKED_DOWNLOAD_THRESHOLD = 200 * 1024 * 1024
+
+
+def download_file(gcs_path: str, local_path: Path, size: int = 0) -> bool:
+    """Download a single GRIB2 file from GCS.
+
+    Downloads run concurrently on a thread pool, so both paths release the
+    GIL (native client I/O, or a gsutil subprocess wait). size is the
+    object size from discovery, used to pick the transfer strategy.
+    """
+    filename = local_path.name
+
+    # A prior seeded run may have left this exact file behind; a matching
+    # size means the transfer can be skipped entirely.
+    try:
+        if size and local_path.stat().st_size == size:
+            _status(f"{Colors.CYAN}✓ Cached: {filename}{Colors.NC}")
+            return True
+    except OSError:
+        pass
 
-        if result.returncode == 0 and local_path.exists():
+    try:
+        with _GCS_SEM:
+            if _CLIENT is not None:
+                blob = _CLIENT.bucket(BUCKET_NAME).blob(gcs_path[len(GCS_PREFIX):])
+                if size > _CHUNKED_DOWNLOAD_THRESHOLD and transfer_manager is not None:
+                    # Chunked downloads need the authoritative object size.
+                    blob.reload()
+                    # THREAD workers: the default PROCESS pool would fork
+                    # from inside an actively multithreaded parent. Each
+                    # download thread gets an equal share of the request
+                    # budget so chunk fetches stay under the semaphore cap.
+                    transfer_manager.download_chunks_concurrently(
+                        blob, str(local_path),
+                        chunk_size=64 * 1024 * 1024,
+                        max_workers=max(1, _GCS_CONCURRENCY // _DOWNLOAD_WORKERS),
+                        worker_type=transfer_manager.THREAD)
+                else:
+                    blob.download_to_filename(str(local_path))
+            else:
+                result = subprocess.run(
+                    ['gsutil', '-q', 'cp', gcs_path, str(local_path)],
+                    capture_output=True,
+                    timeout=300  # 5 minute timeout
+                )
+                if result.returncode != 0:
+                    _status(_DOWNLOAD_FAILED_MSG.format(filename))
+                    return False
+
+        # One stat covers both the existence check and the size report;
+        # these syscalls multiply once many downloads complete concurrently.
+        try:
             size_mb = local_path.stat().st_size / (1024 * 1024)
-            print(f"{Colors.GREEN}✓ Downloaded: {filename} ({size_mb:.1f} MB){Colors.NC}")
-            return True
-        else:
-            print(f"{Colors.YELLOW}✗ Failed to download {filename}{Colors.NC}")
+        except FileNotFoundError:
+            _status(_DOWNLOAD_FAILED_MSG.format(filename))
             return False
 
+        _status(_DOWNLOADED_MSG.format(filename, size_mb))
+        return True
+
     except subprocess.TimeoutExpired:
-        print(f"{Colors.YELLOW}✗ Timeout downloading {filename}{Colors.NC}")
+        _status(_DOWNLOAD_TIMEOUT_MSG.format(filename))
         return False
     except Exception as e:
-        print(f"{Colors.YELLOW}✗ Error downloading {filename}: {e}{Colors.NC}")
+        _status(_DOWNLOAD_ERROR_MSG.format(filename, e))
         return False
 
 
-def test_file(file_path: Path, verbose: bool = False) -> bool:
-    """Run integration test on a file."""
+def download_and_test_files(files_to_download: List[Tuple[str, int]], temp_dir: Path,
+                            verbose: bool = False) -> Tuple[List[Path], dict]:
+    """Download files and test each one as soon as its download completes.
+
+    Download bandwidth and Go test CPU are disjoint resources, so the
+    pipeline makes end-to-end time roughly max(download_time, test_time)
+    instead of their sum. Returns (downloaded, results) where results maps
+    each downloaded path to its pass/fail bool.
+    """
+    downloaded = []
+    test_futures = {}
+
+    with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as dl_pool, \
+         ProcessPoolExecutor(max_workers=os.cpu_count() or 1) as test_pool:
+        dl_futures = {}
+        # gs:// URLs always use '/', so a plain rsplit skips os.path's
+        # platform-abstraction layer
+        for gcs_path, size in files_to_download:
+            local_path = temp_dir / gcs_path.rsplit('/', 1)[-1]
+            dl_futures[dl_pool.submit(download_file, gcs_path, local_path, size)] = local_path
+
+        # Compile the test binary while the first downloads are in flight;
+        # the per-file runs then skip the Go toolchain entirely.
+        test_binary = build_test_binary(temp_dir)
+
+        progress = None
+        if tqdm is not None and not verbose:
+            progress = tqdm(total=len(dl_futures), desc='Downloading', unit='file')
+
+        try:
+            for future in as_completed(dl_futures):
+                local_path = dl_futures[future]
+                ok = future.result()
+                if progress is not None:
+                    progress.update(1)
+                if ok:
+                    downloaded.append(local_path)
+                    test_futures[test_pool.submit(test_file, local_path, verbose, test_binary)] = local_path
+        finally:
+            if progress is not None:
+                progress.close()
+
+        results = {test_futures[f]: f.result() for f in as_completed(test_futures)}
+
+    return downloaded, results
+
+
+def build_test_binary(temp_dir: Path) -> Optional[Path]:
+    """Compile the Go integration test binary once.
+
+    Every 'go test' invocation pays toolchain startup, build-cache checks,
+    and a relink before any test runs; compiling once lets the per-file
+    runs skip all of that. Returns None when compilation fails, in which
+    case the per-file runs fall back to plain 'go test'.
+    """
+    binary = temp_dir / 'squall.test'
+    try:
+        result = subprocess.run(
+            ['go', 'test', '-c', '-o', str(binary)],
+            capture_output=True,
+            text=True,
+            timeout=600
+        )
+        if result.returncode != 0:
+            print(f"{Colors.YELLOW}Failed to precompile test binary, falling back to go test{Colors.NC}")
+            return None
+        return binary
+    except Exception as e:
+        print(f"{Colors.YELLOW}Failed to precompile test binary ({e}), falling back to go test{Colors.NC}")
+        return None
+
+
+def test_file(file_path: Path, verbose: bool = False, test_binary: Optional[Path] = None) -> bool:
+    """Run integration test on a file.
+
+    Tests run concurrently with each other, so the per-file report is
+    buffered and printed in one write to keep output from interleaving.
+    """
     basename = file_path.name
 
-    print(f"\n{Colors.BLUE}{'=' * 60}{Colors.NC}")
-    print(f"{Colors.BOLD}Testing: {basename}{Colors.NC}")
-    print(f"{Colors.BLUE}{'=' * 60}{Colors.NC}")
+    report = [
+        f"\n{Colors.BLUE}{'=' * 60}{Colors.NC}",
+        f"{Colors.BOLD}Testing: {basename}{Colors.NC}",
+        f"{Colors.BLUE}{'=' * 60}{Colors.NC}",
+    ]
 
     try:
-        # Run Go integration test
-        cmd = [
-            'go', 'test',
-            '-v',
-            '-timeout=10m',
-            f'-run=TestIntegrationWithRealFiles/{re.escape(basename)}',
-            '-no-size-limit'
-        ]
+        # Run Go integration test, via the precompiled binary when we have one
+        if test_binary is not None:
+            cmd = [
+                str(test_binary),
+                '-test.v',
+                '-test.timeout=10m',
+                f'-test.run=TestIntegrationWithRealFiles/{re.escape(basename)}',
+                '-no-size-limit'
+            ]
+        else:
+            cmd = [
+                'go', 'test',
+                '-v',
+                '-timeout=10m',
+                f'-run=TestIntegrationWithRealFiles/{re.escape(basename)}',
+                '-no-size-limit'
+            ]
 
         result = subprocess.run(
             cmd,
@@ -236,24 +676,28 @@ def test_file(file_path: Path, verbose: bool = False) -> bool:
             timeout=600  # 10 minute timeout
         )
 
-        # Print output
+        # Include test output
         if verbose or result.returncode != 0:
-            print(result.stdout)
+            report.append(result.stdout)
             if result.stderr:
-                print(result.stderr)
+                report.append(result.stderr)
 
         if result.returncode == 0:
-            print(f"{Colors.GREEN}✓ PASSED: {basename}{Colors.NC}")
+            report.append(_PASS_MSG.format(basename))
+            print('\n'.join(report))
             return True
         else:
-            print(f"{Colors.RED}✗ FAILED: {basename}{Colors.NC}")
+            report.append(_FAIL_MSG.format(basename))
+            print('\n'.join(report))
             return False
 
     except subprocess.TimeoutExpired:
-        print(f"{Colors.RED}✗ TIMEOUT: {basename}{Colors.NC}")
+        report.append(_TEST_TIMEOUT_MSG.format(basename))
+        print('\n'.join(report))
         return False
     except Exception as e:
-        print(f"{Colors.RED}✗ ERROR testing {basename}: {e}{Colors.NC}")
+        report.append(_TEST_ERROR_MSG.format(basename, e))
+        print('\n'.join(report))
         return False
 
 
@@ -272,9 +716,16 @@ def main():
                         help='Maximum file size in MB to download (default: no limit)')
     parser.add_argument('--verbose', action='store_true',
                         help='Show detailed test output')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed file selection for reproducible runs '
+                             '(with --keep-files, repeated runs reuse downloads)')
 
     args = parser.parse_args()
 
+    # A dedicated RNG keeps selection reproducible under --seed and leaves
+    # the global PRNG alone.
+    rng = random.Random(args.seed)
+
     # Print header
     print(f"{Colors.BLUE}{'═' * 60}{Colors.NC}")
     print(f"{Colors.BOLD}  HRRR Random GRIB2 Testing Script{Colors.NC}")
@@ -295,14 +746,19 @@ def main():
     testgribs_dir = Path('testgribs')
     testgribs_dir.mkdir(exist_ok=True)
 
-    temp_dir = testgribs_dir / f"hrrr_random_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    # Seeded runs get a deterministic directory so a rerun with the same
+    # seed (after --keep-files) finds its earlier downloads in place.
+    if args.seed is not None:
+        temp_dir = testgribs_dir / f"hrrr_random_seed{args.seed}"
+    else:
+        temp_dir = testgribs_dir / f"hrrr_random_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
     temp_dir.mkdir(exist_ok=True)
 
     print(f"Output directory: {Colors.CYAN}{temp_dir}{Colors.NC}\n")
 
     try:
         # Get available dates (all available from 2014 to present)
-        dates = get_available_dates()
+        dates = get_available_dates(rng)
         if not dates:
             print(f"{Colors.RED}Error: Could not generate date range.{Colors.NC}")
             return 1
@@ -314,32 +770,24 @@ def main():
         else:
             print(f"\n{Colors.BLUE}Searching for {args.num_files} files (no size limit)...{Colors.NC}")
 
-        files_to_download = []
-        dates_tried = 0
-        dates_with_files = 0
-
-        for date in dates:
-            if len(files_to_download) >= args.num_files:
-                break
-
-            dates_tried += 1
-
-            # Try to get 1-2 files from this date
-            date_files = get_random_files_from_date(date, 2, args.max_size, verbose=args.verbose)
-
-            if date_files:
-                dates_with_files += 1
-                files_to_download.extend(date_files)
-
-                if not args.verbose:
-                    # Show progress dots
-                    if dates_with_files % 5 == 0:
-                        print(f"  Found {len(files_to_download)} files so far (tried {dates_tried} dates)...")
-
-            # Safety limit: don't try forever
-            if dates_tried >= 20:
-                print(f"\n{Colors.YELLOW}Tried {dates_tried} dates, stopping search.{Colors.NC}")
-                break
+        files_to_download, dates_tried, dates_with_files = collect_candidate_files(
+            dates, args.num_files, args.max_size, rng, verbose=args.verbose)
+
+        # HRRR basenames repeat across dates (same cycle and forecast
+        # hour), and the pipeline maps every candidate to
+        # temp_dir/<basename>, so keep one candidate per basename: two
+        # concurrent downloads must never share a local path.
+        seen_names = set()
+        unique_files = []
+        for url, size in files_to_download:
+            name = url.rsplit('/', 1)[-1]
+            if name not in seen_names:
+                seen_names.add(name)
+                unique_files.append((url, size))
+        files_to_download = unique_files
+
+        if len(files_to_download) < args.num_files:
+            print(f"\n{Colors.YELLOW}Tried {dates_tried} dates, stopping search.{Colors.NC}")
 
         # Trim to requested number
         files_to_download = files_to_download[:args.num_files]
@@ -353,31 +801,22 @@ def main():
         print(f"\n{Colors.GREEN}Selected {len(files_to_download)} files for testing{Colors.NC}")
         print(f"  (Searched {dates_tried} dates, found files in {dates_with_files} dates)")
 
-        # Download files
-        print(f"\n{Colors.BLUE}Downloading files...{Colors.NC}")
-        downloaded = []
-
-        for gcs_path, size in files_to_download:
-            filename = os.path.basename(gcs_path)
-            local_path = temp_dir / filename
-
-            if download_file(gcs_path, local_path):
-                downloaded.append(local_path)
+        # Download files, testing each one as soon as it lands so download
+        # bandwidth and test CPU stay busy at the same time.
+        print(f"\n{Colors.BLUE}Downloading and testing files...{Colors.NC}")
+        downloaded, results = download_and_test_files(files_to_download, temp_dir,
+                                                      verbose=args.verbose)
 
         if not downloaded:
             print(f"{Colors.RED}Error: No files were successfully downloaded.{Colors.NC}")
             return 1
 
-        print(f"\n{Colors.GREEN}Successfully downloaded {len(downloaded)} files{Colors.NC}")
-
-        # Test each file
-        print(f"\n{Colors.BLUE}Running integration tests...{Colors.NC}")
         passed = 0
         failed = 0
         failed_files = []
 
         for file_path in downloaded:
-            if test_file(file_path, verbose=args.verbose):
+            if results[file_path]:
                 passed += 1
             else:
                 failed += 1
@@ -402,8 +841,17 @@ def main():
             print(f"\nTest files kept at: {Colors.CYAN}{temp_dir}{Colors.NC}")
         else:
             print(f"\n{Colors.YELLOW}Cleaning up downloaded files...{Colors.NC}")
-            shutil.rmtree(temp_dir)
-            print(f"{Colors.GREEN}Cleanup complete.{Colors.NC}")
+            if os.name == 'nt':
+                shutil.rmtree(temp_dir)
+                print(f"{Colors.GREEN}Cleanup complete.{Colors.NC}")
+            else:
+                # Fire-and-forget: rm -rf finishes on its own while the
+                # script exits, instead of Python stat+unlink'ing each of
+                # the downloaded files in turn.
+                subprocess.Popen(['rm', '-rf', str(temp_dir)],
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
+                print(f"{Colors.GREEN}Cleanup started in background.{Colors.NC}")
 
         # Exit with appropriate code
         if failed > 0: